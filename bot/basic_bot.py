@@ -15,6 +15,9 @@ logger = logging.getLogger(__name__)
 
 
 class BasicBot:
+    
+    # Seconds before cached exchange info (symbols, filters) is fetched again
+    EXCHANGE_INFO_TTL = 300.0
    
     def __init__(self, api_key: str, api_secret: str, testnet: bool = True) -> None:
         if not api_key or not api_secret:
@@ -28,8 +31,10 @@ class BasicBot:
                 self.client.API_URL = 'https://testnet.binancefuture.com/fapi'
                 logger.info("Configured for Binance Futures testnet")
             
-            self.exchange_info: Optional[Dict] = None
+            self._symbol_index: Optional[Dict[str, Dict]] = None
+            self.exchange_info = None
             self.symbol_filters: Dict[str, Dict] = {}
+            self._exchange_info_fetched_at = 0.0
             self.time_offset = 0
             
             self._sync_time_with_binance()
@@ -44,9 +49,20 @@ class BasicBot:
             logger.error(f"Unexpected error during initialization: {e}")
             raise
     
+    @property
+    def exchange_info(self) -> Optional[Dict]:
+        return self._exchange_info
+    
+    @exchange_info.setter
+    def exchange_info(self, value: Optional[Dict]) -> None:
+        # The symbol index is derived from this data, so any replacement invalidates it
+        self._exchange_info = value
+        self._symbol_index = None
+    
     def _initialize_exchange_info(self) -> None:
         try:
             self.exchange_info = self._make_api_call(self.client.futures_exchange_info)
+            self._exchange_info_fetched_at = time.monotonic()
             
 
             for symbol_info in self.exchange_info['symbols']:
@@ -137,15 +153,32 @@ class BasicBot:
                 logger.error(f"Unexpected error in API call: {e}")
                 raise
     
+    def get_symbol_info(self, symbol: str) -> Optional[Dict]:
+        expired = time.monotonic() - self._exchange_info_fetched_at >= self.EXCHANGE_INFO_TTL
+        
+        if not self.exchange_info:
+            self._initialize_exchange_info()
+        elif expired:
+            try:
+                self._initialize_exchange_info()
+            except Exception as e:
+                # Stale symbol data is still usable; try again after another TTL
+                logger.warning(f"Failed to refresh exchange info, using cached data: {e}")
+                self._exchange_info_fetched_at = time.monotonic()
+        
+        if self._symbol_index is None:
+            self._symbol_index = {
+                symbol_info['symbol']: symbol_info
+                for symbol_info in self.exchange_info['symbols']
+            }
+        
+        return self._symbol_index.get(symbol.upper())
+    
     def validate_symbol(self, symbol: str) -> bool:
         try:
-            if not self.exchange_info:
-                self._initialize_exchange_info()
-                
-            for symbol_info in self.exchange_info['symbols']:
-                if (symbol_info['symbol'] == symbol.upper() and 
-                    symbol_info['status'] == 'TRADING'):
-                    return True
+            symbol_info = self.get_symbol_info(symbol)
+            if symbol_info is not None and symbol_info['status'] == 'TRADING':
+                return True
                     
             logger.warning(f"Symbol {symbol} not found or not tradeable")
             return False
@@ -1,14 +1,28 @@
 import os
 import time
+import random
 import logging
 import functools
+import threading
 from typing import Any, Callable, Dict, Optional, Union, Tuple
-from decimal import Decimal, ROUND_DOWN, ROUND_UP
+from decimal import Decimal, ROUND_DOWN, ROUND_UP, ROUND_FLOOR, getcontext
 import asyncio
+from dataclasses import dataclass
 from dotenv import load_dotenv
 
 logger = logging.getLogger(__name__)
 
+# Binance error codes that will not succeed on retry (timestamp/signature, order rejections)
+_NO_RETRY_CODES = frozenset({-1021, -1022, -2010, -2011, -2013, -2014, -2015})
+_SENTINEL = object()
+
+_VALID_SIDES = frozenset({'BUY', 'SELL'})
+_VALID_TIF = frozenset({'GTC', 'IOC', 'FOK', 'GTX'})
+_is_valid_side = _VALID_SIDES.__contains__
+_is_valid_tif = _VALID_TIF.__contains__
+_INVALID_SIDE_MESSAGE = f"Side must be one of {sorted(_VALID_SIDES)}"
+_INVALID_TIF_MESSAGE = f"Time in force must be one of {sorted(_VALID_TIF)}"
+
 
 class RetryExhaustedError(Exception):
     pass
@@ -50,6 +64,60 @@ def load_environment_variables() -> Dict[str, str]:
     return env_vars
 
 
+def _backoff_delays(
+    max_retries: int,
+    base_delay: float,
+    max_delay: float,
+    backoff_factor: float
+) -> Tuple[float, ...]:
+    
+    return tuple(min(base_delay * backoff_factor ** i, max_delay) for i in range(max_retries))
+
+
+def _compute_delay(
+    delays: Tuple[float, ...],
+    attempt: int,
+    jitter: bool,
+    _rand: Callable[[], float] = random.random
+) -> float:
+    
+    delay = delays[attempt]
+    if jitter:
+        # Full jitter spreads concurrent retries over the whole window
+        delay *= _rand()
+    return delay
+
+
+def _retry_delay(
+    e: Exception,
+    attempt: int,
+    delays: Tuple[float, ...],
+    jitter: bool,
+    func_name: str
+) -> Optional[float]:
+    # Shared by both backoff decorators and only called after a failure, so their success
+    # path stays a bare call: re-raises non-retryable errors, returns None once retries
+    # are exhausted, otherwise the delay before the next attempt
+    max_retries = len(delays)
+    
+    code = getattr(e, 'code', _SENTINEL)
+    if code is not _SENTINEL and code in _NO_RETRY_CODES:
+        logger.error("Non-retryable error %s: %s", code, e)
+        raise e
+    
+    if attempt == max_retries:
+        logger.error("All %d attempts failed for %s", max_retries + 1, func_name)
+        return None
+    
+    delay = _compute_delay(delays, attempt, jitter)
+    
+    logger.warning(
+        "Attempt %d/%d failed for %s: %s. Retrying in %.2fs",
+        attempt + 1, max_retries + 1, func_name, e, delay
+    )
+    return delay
+
+
 def exponential_backoff(
     max_retries: int = 3,
     base_delay: float = 1.0,
@@ -57,43 +125,27 @@ def exponential_backoff(
     backoff_factor: float = 2.0,
     jitter: bool = True
 ) -> Callable:
+    
+    delays = _backoff_delays(max_retries, base_delay, max_delay, backoff_factor)
+    _sleep = time.sleep
    
     def decorator(func: Callable) -> Callable:
+        func_name = func.__name__
+        
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            last_exception = None
+            attempt = 0
             
-            for attempt in range(max_retries + 1):
+            while True:
                 try:
                     return func(*args, **kwargs)
                 except Exception as e:
                     last_exception = e
-                    
-
-                    if hasattr(e, 'code'):
-
-                        no_retry_codes = [-1021, -1022, -2010, -2011, -2013, -2014, -2015]
-                        if getattr(e, 'code', None) in no_retry_codes:
-                            logger.error(f"Non-retryable error {e.code}: {e}")
-                            raise e
-                    
-                    if attempt == max_retries:
-                        logger.error(f"All {max_retries + 1} attempts failed for {func.__name__}")
+                    delay = _retry_delay(e, attempt, delays, jitter, func_name)
+                    if delay is None:
                         break
-                    
-
-                    delay = min(base_delay * (backoff_factor ** attempt), max_delay)
-                    
-
-                    if jitter:
-                        import random
-                        delay *= (0.5 + random.random() * 0.5)
-                    
-                    logger.warning(
-                        f"Attempt {attempt + 1}/{max_retries + 1} failed for {func.__name__}: {e}. "
-                        f"Retrying in {delay:.2f}s"
-                    )
-                    time.sleep(delay)
+                _sleep(delay)
+                attempt += 1
             
             raise RetryExhaustedError(f"Failed after {max_retries + 1} attempts: {last_exception}")
         
@@ -101,7 +153,7 @@ def exponential_backoff(
     return decorator
 
 
-async def async_exponential_backoff(
+def async_exponential_backoff(
     max_retries: int = 3,
     base_delay: float = 1.0,
     max_delay: float = 60.0,
@@ -109,41 +161,26 @@ async def async_exponential_backoff(
     jitter: bool = True
 ) -> Callable:
     
+    delays = _backoff_delays(max_retries, base_delay, max_delay, backoff_factor)
+    _sleep = asyncio.sleep
+    
     def decorator(func: Callable) -> Callable:
+        func_name = func.__name__
+        
         @functools.wraps(func)
         async def wrapper(*args, **kwargs):
-            last_exception = None
+            attempt = 0
             
-            for attempt in range(max_retries + 1):
+            while True:
                 try:
                     return await func(*args, **kwargs)
                 except Exception as e:
                     last_exception = e
-                    
-
-                    if hasattr(e, 'code'):
-                        no_retry_codes = [-1021, -1022, -2010, -2011, -2013, -2014, -2015]
-                        if getattr(e, 'code', None) in no_retry_codes:
-                            logger.error(f"Non-retryable error {e.code}: {e}")
-                            raise e
-                    
-                    if attempt == max_retries:
-                        logger.error(f"All {max_retries + 1} attempts failed for {func.__name__}")
+                    delay = _retry_delay(e, attempt, delays, jitter, func_name)
+                    if delay is None:
                         break
-                    
-
-                    delay = min(base_delay * (backoff_factor ** attempt), max_delay)
-                    
-
-                    if jitter:
-                        import random
-                        delay *= (0.5 + random.random() * 0.5)
-                    
-                    logger.warning(
-                        f"Attempt {attempt + 1}/{max_retries + 1} failed for {func.__name__}: {e}. "
-                        f"Retrying in {delay:.2f}s"
-                    )
-                    await asyncio.sleep(delay)
+                await _sleep(delay)
+                attempt += 1
             
             raise RetryExhaustedError(f"Failed after {max_retries + 1} attempts: {last_exception}")
         
@@ -157,52 +194,148 @@ def safe_api_call(func: Callable) -> Callable:
     def wrapper(*args, **kwargs):
         try:
             result = func(*args, **kwargs)
-            logger.debug(f"API call {func.__name__} successful")
+            logger.debug("API call %s successful", func.__name__)
             return result
         except Exception as e:
-            logger.error(f"API call {func.__name__} failed: {type(e).__name__}: {e}")
+            logger.error("API call %s failed: %s: %s", func.__name__, type(e).__name__, e)
             
 
-            if hasattr(e, 'response'):
-                logger.error(f"Response status: {getattr(e.response, 'status_code', 'Unknown')}")
-                logger.error(f"Response text: {getattr(e.response, 'text', 'Unknown')}")
+            # response.text may read the whole body, so only touch it when it will be logged
+            if hasattr(e, 'response') and logger.isEnabledFor(logging.ERROR):
+                logger.error("Response status: %s", getattr(e.response, 'status_code', 'Unknown'))
+                logger.error("Response text: %s", getattr(e.response, 'text', 'Unknown'))
             
             raise e
     
     return wrapper
 
 
-def format_quantity(quantity: Union[str, float, Decimal], precision: int) -> str:
-   
-    decimal_quantity = Decimal(str(quantity))
-    
+def _to_decimal(value: Union[str, int, float, Decimal]) -> Decimal:
+    # Decimal(str(...)) round-trips through the string parser; skip it when the type allows
+    if type(value) is Decimal:
+        return value
+    if type(value) is int:
+        return Decimal(value)
+    return Decimal(str(value))
 
-    format_str = f"{{:.{precision}f}}"
-    
 
-    multiplier = Decimal(10) ** precision
-    rounded_quantity = decimal_quantity.quantize(Decimal('1') / multiplier, rounding=ROUND_DOWN)
-    
-    return format_str.format(float(rounded_quantity))
+@functools.lru_cache(maxsize=32)
+def _fmt(precision: int) -> str:
+    return f"{{:.{precision}f}}"
 
 
-def format_price(price: Union[str, float, Decimal], tick_size: Union[str, float, Decimal]) -> str:
-    
-    decimal_price = Decimal(str(price))
-    decimal_tick_size = Decimal(str(tick_size))
-    
+@functools.lru_cache(maxsize=32)
+def _quantum(precision: int) -> Decimal:
+    return Decimal(1).scaleb(-precision)
+
 
-    rounded_price = (decimal_price / decimal_tick_size).quantize(Decimal('1'), rounding=ROUND_DOWN) * decimal_tick_size
+def format_quantity(quantity: Union[str, float, Decimal], precision: int) -> str:
+   
+    decimal_quantity = _to_decimal(quantity)
+    rounded_quantity = decimal_quantity.quantize(_quantum(precision), rounding=ROUND_DOWN)
     
+    return _fmt(precision).format(float(rounded_quantity))
 
-    tick_str = str(decimal_tick_size)
+
+def _decimal_exponent(value: Decimal) -> int:
+    # Smallest power-of-ten exponent that makes value an integer; exponent-form strings
+    # such as '1E-8' have no '.', so this cannot be read off the string
+    return max(0, -value.normalize().as_tuple().exponent)
+
+
+@functools.lru_cache(maxsize=256)
+def _tick_state(tick_size_str: str) -> Tuple[Decimal, int, int, int]:
+    # Tick/step sizes come from exchange filters and rarely change, so parse them once.
+    # Returns (tick size, display precision, exponent making the tick an integer, tick in those units).
+    tick_size = Decimal(tick_size_str)
+    tick_str = str(tick_size)
     if '.' in tick_str:
         precision = len(tick_str.split('.')[1].rstrip('0'))
     else:
         precision = 0
+    exponent = _decimal_exponent(tick_size)
+    return tick_size, precision, exponent, int(tick_size.scaleb(exponent))
+
+
+def _round_to_tick(price: Decimal, exponent: int, tick_units: int) -> int:
+    # Rounds toward zero to a multiple of the tick, in integer units of 10**-exponent
+    units = int(price.scaleb(exponent).to_integral_value(rounding=ROUND_DOWN))
+    rounded = abs(units) // tick_units * tick_units
+    return -rounded if units < 0 else rounded
+
+
+def format_price(price: Union[str, float, Decimal], tick_size: Union[str, float, Decimal]) -> str:
     
-    format_str = f"{{:.{precision}f}}"
-    return format_str.format(float(rounded_price))
+    _, precision, exponent, tick_units = _tick_state(str(tick_size))
+    rounded_units = _round_to_tick(_to_decimal(price), exponent, tick_units)
+    
+    return _fmt(precision).format(rounded_units / 10 ** exponent)
+
+
+def _require_price(
+    params: Dict[str, Any], order_type: str, price: Optional[Union[str, float]], time_in_force: Optional[str]
+) -> None:
+    if price is None:
+        raise ValidationError(f"{order_type} orders require price")
+    if time_in_force is None:
+        params['timeInForce'] = 'GTC'
+
+
+def _require_stop_price(order_type: str, stop_price: Optional[Union[str, float]]) -> None:
+    if stop_price is None:
+        raise ValidationError(f"{order_type} orders require stop price")
+
+
+# Per-order-type finishing checks, run once the common fields are validated
+
+def _finish_market(
+    params: Dict[str, Any], order_type: str, price: Optional[Union[str, float]],
+    time_in_force: Optional[str], stop_price: Optional[Union[str, float]]
+) -> None:
+    params.pop('price', None)
+    params.pop('timeInForce', None)
+
+
+def _finish_limit(
+    params: Dict[str, Any], order_type: str, price: Optional[Union[str, float]],
+    time_in_force: Optional[str], stop_price: Optional[Union[str, float]]
+) -> None:
+    _require_price(params, order_type, price, time_in_force)
+
+
+def _finish_stop_market(
+    params: Dict[str, Any], order_type: str, price: Optional[Union[str, float]],
+    time_in_force: Optional[str], stop_price: Optional[Union[str, float]]
+) -> None:
+    _require_stop_price(order_type, stop_price)
+
+
+def _finish_stop_limit(
+    params: Dict[str, Any], order_type: str, price: Optional[Union[str, float]],
+    time_in_force: Optional[str], stop_price: Optional[Union[str, float]]
+) -> None:
+    _require_price(params, order_type, price, time_in_force)
+    _require_stop_price(order_type, stop_price)
+
+
+def _finish_trailing_stop(
+    params: Dict[str, Any], order_type: str, price: Optional[Union[str, float]],
+    time_in_force: Optional[str], stop_price: Optional[Union[str, float]]
+) -> None:
+    pass
+
+
+_ORDER_TYPE_CHECKS: Dict[str, Callable[..., None]] = {
+    'MARKET': _finish_market,
+    'LIMIT': _finish_limit,
+    'STOP_MARKET': _finish_stop_market,
+    'STOP': _finish_stop_limit,
+    'TAKE_PROFIT_MARKET': _finish_stop_market,
+    'TAKE_PROFIT': _finish_stop_limit,
+    'TRAILING_STOP_MARKET': _finish_trailing_stop
+}
+_VALID_ORDER_TYPES = frozenset(_ORDER_TYPE_CHECKS)
+_INVALID_ORDER_TYPE_MESSAGE = f"Order type must be one of {sorted(_VALID_ORDER_TYPES)}"
 
 
 def validate_order_parameters(
@@ -219,16 +352,14 @@ def validate_order_parameters(
     if not symbol or not isinstance(symbol, str):
         raise ValidationError("Symbol must be a non-empty string")
     
-    valid_sides = ['BUY', 'SELL']
-    if side not in valid_sides:
-        raise ValidationError(f"Side must be one of {valid_sides}")
+    # Frozenset/dict lookups hash their argument; the str checks keep unhashable input
+    # (e.g. a list) a ValidationError rather than a TypeError
+    if not isinstance(side, str) or not _is_valid_side(side):
+        raise ValidationError(_INVALID_SIDE_MESSAGE)
     
-    valid_order_types = [
-        'MARKET', 'LIMIT', 'STOP_MARKET', 'STOP', 'TAKE_PROFIT_MARKET',
-        'TAKE_PROFIT', 'TRAILING_STOP_MARKET'
-    ]
-    if order_type not in valid_order_types:
-        raise ValidationError(f"Order type must be one of {valid_order_types}")
+    finish_checks = _ORDER_TYPE_CHECKS.get(order_type) if isinstance(order_type, str) else None
+    if finish_checks is None:
+        raise ValidationError(_INVALID_ORDER_TYPE_MESSAGE)
     
 
     params = {
@@ -240,7 +371,7 @@ def validate_order_parameters(
 
     if quantity is not None:
         try:
-            quantity_decimal = Decimal(str(quantity))
+            quantity_decimal = _to_decimal(quantity)
             if quantity_decimal <= 0:
                 raise ValidationError("Quantity must be positive")
             params['quantity'] = str(quantity)
@@ -250,7 +381,7 @@ def validate_order_parameters(
 
     if price is not None:
         try:
-            price_decimal = Decimal(str(price))
+            price_decimal = _to_decimal(price)
             if price_decimal <= 0:
                 raise ValidationError("Price must be positive")
             params['price'] = str(price)
@@ -260,7 +391,7 @@ def validate_order_parameters(
 
     if stop_price is not None:
         try:
-            stop_price_decimal = Decimal(str(stop_price))
+            stop_price_decimal = _to_decimal(stop_price)
             if stop_price_decimal <= 0:
                 raise ValidationError("Stop price must be positive")
             params['stopPrice'] = str(stop_price)
@@ -269,9 +400,8 @@ def validate_order_parameters(
     
 
     if time_in_force is not None:
-        valid_tif = ['GTC', 'IOC', 'FOK', 'GTX']
-        if time_in_force not in valid_tif:
-            raise ValidationError(f"Time in force must be one of {valid_tif}")
+        if not isinstance(time_in_force, str) or not _is_valid_tif(time_in_force):
+            raise ValidationError(_INVALID_TIF_MESSAGE)
         params['timeInForce'] = time_in_force
     
 
@@ -279,29 +409,136 @@ def validate_order_parameters(
         if value is not None:
             params[key] = value
     
-
-    if order_type in ['LIMIT', 'STOP', 'TAKE_PROFIT']:
-        if price is None:
-            raise ValidationError(f"{order_type} orders require price")
-        if time_in_force is None:
-            params['timeInForce'] = 'GTC'
-    
-    if order_type in ['STOP_MARKET', 'STOP', 'TAKE_PROFIT_MARKET', 'TAKE_PROFIT']:
-        if stop_price is None:
-            raise ValidationError(f"{order_type} orders require stop price")
+    finish_checks(params, order_type, price, time_in_force, stop_price)
     
-    if order_type == 'MARKET':
-
-        params.pop('price', None)
-        params.pop('timeInForce', None)
-    
-    logger.debug(f"Validated order parameters: {params}")
+    logger.debug("Validated order parameters: %s", params)
     return params
 
 
 def calculate_notional_value(quantity: Union[str, float, Decimal], price: Union[str, float, Decimal]) -> Decimal:
     
-    return Decimal(str(quantity)) * Decimal(str(price))
+    return _to_decimal(quantity) * _to_decimal(price)
+
+
+def _to_scaled_int(value: Decimal, exponent: int) -> Tuple[int, bool]:
+    # Returns floor(value * 10**exponent) and whether the scaling was exact
+    scaled = value.scaleb(exponent)
+    whole = int(scaled.to_integral_value(rounding=ROUND_FLOOR))
+    return whole, whole == scaled
+
+
+@dataclass(frozen=True)
+class _RangeFilter:
+    min_value: Decimal
+    max_value: Decimal
+    step: Decimal
+    exponent: int
+    min_int: int
+    max_int: int
+    step_int: int
+    
+    @classmethod
+    def parse(cls, min_value: str, max_value: str, step: str) -> '_RangeFilter':
+        min_dec, max_dec, step_dec = Decimal(min_value), Decimal(max_value), Decimal(step)
+        # Computed directly: routing every bound through _tick_state would evict format_price's ticks
+        exponent = max(_decimal_exponent(min_dec), _decimal_exponent(max_dec), _decimal_exponent(step_dec))
+        return cls(
+            min_value=min_dec,
+            max_value=max_dec,
+            step=step_dec,
+            exponent=exponent,
+            min_int=_to_scaled_int(min_dec, exponent)[0],
+            max_int=_to_scaled_int(max_dec, exponent)[0],
+            step_int=_to_scaled_int(step_dec, exponent)[0]
+        )
+    
+    def violation(self, value: Decimal) -> Optional[str]:
+        value_int, exact = _to_scaled_int(value, self.exponent)
+        
+        if value_int < self.min_int:
+            return 'below'
+        if value_int > self.max_int or (value_int == self.max_int and not exact):
+            return 'above'
+        if not exact or (value_int - self.min_int) % self.step_int != 0:
+            return 'step'
+        return None
+
+
+def _check_lot_size(lot_size: _RangeFilter, quantity: Decimal, price: Optional[Decimal]) -> Optional[str]:
+    violation = lot_size.violation(quantity)
+    if violation == 'below':
+        return f"Quantity {quantity} below minimum {lot_size.min_value}"
+    if violation == 'above':
+        return f"Quantity {quantity} above maximum {lot_size.max_value}"
+    if violation == 'step':
+        return f"Quantity {quantity} not aligned with step size {lot_size.step}"
+    return None
+
+
+def _check_price_filter(price_filter: _RangeFilter, quantity: Decimal, price: Optional[Decimal]) -> Optional[str]:
+    if not price:
+        return None
+    violation = price_filter.violation(price)
+    if violation == 'below':
+        return f"Price {price} below minimum {price_filter.min_value}"
+    if violation == 'above':
+        return f"Price {price} above maximum {price_filter.max_value}"
+    if violation == 'step':
+        return f"Price {price} not aligned with tick size {price_filter.step}"
+    return None
+
+
+def _check_min_notional(min_notional: Decimal, quantity: Decimal, price: Optional[Decimal]) -> Optional[str]:
+    if not price:
+        return None
+    notional = calculate_notional_value(quantity, price)
+    if notional < min_notional:
+        return f"Notional value {notional} below minimum {min_notional}"
+    return None
+
+
+_FilterCheck = Callable[[Any, Decimal, Optional[Decimal]], Optional[str]]
+
+# filterType -> (parse the raw exchange filter once, check an order against the parsed form),
+# in the order the checks are applied
+_FILTER_HANDLERS: Dict[str, Tuple[Callable[[Dict[str, Any]], Any], _FilterCheck]] = {
+    'LOT_SIZE': (
+        lambda f: _RangeFilter.parse(f['minQty'], f['maxQty'], f['stepSize']),
+        _check_lot_size
+    ),
+    'PRICE_FILTER': (
+        lambda f: _RangeFilter.parse(f['minPrice'], f['maxPrice'], f['tickSize']),
+        _check_price_filter
+    ),
+    'MIN_NOTIONAL': (
+        lambda f: Decimal(f['minNotional']),
+        _check_min_notional
+    )
+}
+
+
+_PARSED_FILTERS_MAX = 512
+# id(symbol_info) -> (symbol_info, parsed); holding the dict keeps its id from being reused
+_parsed_filters_cache: Dict[int, Tuple[Dict[str, Any], Tuple[Tuple[_FilterCheck, Any], ...]]] = {}
+
+
+def _parse_filters(symbol_info: Dict[str, Any]) -> Tuple[Tuple[_FilterCheck, Any], ...]:
+    
+    cached = _parsed_filters_cache.get(id(symbol_info))
+    if cached is not None and cached[0] is symbol_info:
+        return cached[1]
+    
+    index = {f['filterType']: f for f in symbol_info.get('filters', [])}
+    parsed = tuple(
+        (check, parse(index[name]))
+        for name, (parse, check) in _FILTER_HANDLERS.items()
+        if name in index
+    )
+    
+    if len(_parsed_filters_cache) >= _PARSED_FILTERS_MAX:
+        _parsed_filters_cache.clear()
+    _parsed_filters_cache[id(symbol_info)] = (symbol_info, parsed)
+    return parsed
 
 
 def validate_filters(
@@ -310,44 +547,17 @@ def validate_filters(
 ) -> Tuple[bool, Optional[str]]:
     
     try:
-        filters = {f['filterType']: f for f in symbol_info.get('filters', [])}
-        quantity = Decimal(str(params.get('quantity', 0)))
-        price = Decimal(str(params.get('price', 0))) if params.get('price') else None
-        
-
-        if 'LOT_SIZE' in filters:
-            lot_filter = filters['LOT_SIZE']
-            min_qty = Decimal(lot_filter['minQty'])
-            max_qty = Decimal(lot_filter['maxQty'])
-            step_size = Decimal(lot_filter['stepSize'])
-            
-            if quantity < min_qty:
-                return False, f"Quantity {quantity} below minimum {min_qty}"
-            if quantity > max_qty:
-                return False, f"Quantity {quantity} above maximum {max_qty}"
-            if (quantity - min_qty) % step_size != 0:
-                return False, f"Quantity {quantity} not aligned with step size {step_size}"
+        if not symbol_info.get('filters'):
+            return True, None
         
-
-        if price and 'PRICE_FILTER' in filters:
-            price_filter = filters['PRICE_FILTER']
-            min_price = Decimal(price_filter['minPrice'])
-            max_price = Decimal(price_filter['maxPrice'])
-            tick_size = Decimal(price_filter['tickSize'])
-            
-            if price < min_price:
-                return False, f"Price {price} below minimum {min_price}"
-            if price > max_price:
-                return False, f"Price {price} above maximum {max_price}"
-            if (price - min_price) % tick_size != 0:
-                return False, f"Price {price} not aligned with tick size {tick_size}"
+        checks = _parse_filters(symbol_info)
+        quantity = _to_decimal(params.get('quantity', 0))
+        price = _to_decimal(params.get('price', 0)) if params.get('price') else None
         
-
-        if 'MIN_NOTIONAL' in filters and price:
-            min_notional = Decimal(filters['MIN_NOTIONAL']['minNotional'])
-            notional = calculate_notional_value(quantity, price)
-            if notional < min_notional:
-                return False, f"Notional value {notional} below minimum {min_notional}"
+        for check, parsed_filter in checks:
+            error = check(parsed_filter, quantity, price)
+            if error is not None:
+                return False, error
         
         return True, None
         
@@ -357,48 +567,110 @@ def validate_filters(
 
 def get_precision_from_step_size(step_size: Union[str, float, Decimal]) -> int:
    
-    step_str = str(Decimal(str(step_size)))
-    if '.' in step_str:
-        return len(step_str.split('.')[1].rstrip('0'))
-    return 0
+    return _tick_state(str(step_size))[1]
 
 
 def truncate_to_precision(value: Union[str, float, Decimal], precision: int) -> str:
     
-    decimal_value = Decimal(str(value))
-    multiplier = Decimal(10) ** precision
-    truncated = int(decimal_value * multiplier) / multiplier
+    decimal_value = _to_decimal(value)
+    
+    # quantize raises InvalidOperation once the result needs more digits than the
+    # context precision (28 by default), so widen it for those values only
+    context = getcontext()
+    digits = decimal_value.adjusted() + precision + 1
+    if digits > context.prec:
+        context = context.copy()
+        context.prec = digits
     
-    format_str = f"{{:.{precision}f}}"
-    return format_str.format(truncated)
+    truncated = decimal_value.quantize(_quantum(precision), rounding=ROUND_DOWN, context=context)
+    if not truncated:
+        truncated = truncated.copy_abs()
+    
+    return _fmt(precision).format(truncated)
 
 
 
 class RateLimiter:
     
-    def __init__(self, max_requests: int = 10, time_window: float = 60.0):
+    # Monotonic so wall-clock adjustments (NTP, DST) cannot shrink or stretch the window;
+    # integer nanoseconds keep the bucket bookkeeping in exact int arithmetic
+    _now = staticmethod(time.monotonic_ns)
+    
+    def __init__(
+        self,
+        max_requests: int = 10,
+        time_window: float = 60.0,
+        time_source: Optional[Callable[[], int]] = None
+    ):
     
+        if time_window <= 0:
+            raise ValueError("time_window must be positive")
+        
+        # time_source must return integer nanoseconds like time.monotonic_ns; injectable for tests
+        if time_source is not None:
+            self._now = time_source
         self.max_requests = max_requests
         self.time_window = time_window
-        self.requests = []
+        self._window_ns = max(1, int(time_window * 1_000_000_000))
+        # Sliding window approximated by two fixed buckets: the previous window's count
+        # is weighted by how much of it still overlaps the trailing time_window
+        self._prev_count = 0
+        self._curr_count = 0
+        self._window_start = self._now()
+        self._lock = threading.Lock()
+    
+    def _roll(self, now: int) -> int:
+        # Advance to the bucket containing `now`; returns the nanoseconds elapsed in it
+        elapsed = now - self._window_start
+        if elapsed >= self._window_ns:
+            windows = elapsed // self._window_ns
+            self._prev_count = self._curr_count if windows == 1 else 0
+            self._curr_count = 0
+            self._window_start += windows * self._window_ns
+            elapsed -= windows * self._window_ns
+        return elapsed
+    
+    @staticmethod
+    def _first_admitting_ns(prev: int, curr: int, max_requests: int, window_ns: int) -> int:
+        # Earliest elapsed ns at which prev * (1 - elapsed / window) + curr < max_requests,
+        # i.e. prev * (window - elapsed) < (max_requests - curr) * window, solved in ints
+        if not prev:
+            return 0
+        # Ceiling division: the trailing ns the previous bucket may still overlap
+        overlap = -(-(max_requests - curr) * window_ns // prev)
+        return window_ns - overlap + 1
     
     def acquire(self) -> bool:
        
-        now = time.time()
-        
-
-        self.requests = [req_time for req_time in self.requests if now - req_time < self.time_window]
+        now = self._now()
         
-        if len(self.requests) >= self.max_requests:
-            return False
-        
-        self.requests.append(now)
-        return True
+        with self._lock:
+            elapsed = self._roll(now)
+            # Exact integer form of weighted < max_requests, so it agrees with wait_time
+            admitted = (
+                self._prev_count * (self._window_ns - elapsed)
+                < (self.max_requests - self._curr_count) * self._window_ns
+            )
+            
+            if not admitted:
+                return False
+            
+            self._curr_count += 1
+            return True
     
     def wait_time(self) -> float:
         
-        if len(self.requests) < self.max_requests:
-            return 0.0
+        now = self._now()
         
-        oldest_request = min(self.requests)
-        return self.time_window - (time.time() - oldest_request)
\ No newline at end of file
+        with self._lock:
+            elapsed = self._roll(now)
+            window_ns = self._window_ns
+            
+            if self._curr_count < self.max_requests:
+                # Wait until the previous bucket's weight has decayed enough to admit one request
+                ready = self._first_admitting_ns(self._prev_count, self._curr_count, self.max_requests, window_ns)
+            else:
+                # Nothing frees up until the current bucket becomes the previous one
+                ready = window_ns + self._first_admitting_ns(self._curr_count, 0, self.max_requests, window_ns)
+            
+            return max(0, ready - elapsed) / 1_000_000_000
@@ -0,0 +1,97 @@
+import os
+from types import MappingProxyType
+from unittest.mock import Mock
+
+import pytest
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "integration: marks tests as integration tests (deselect with '-m \"not integration\"')"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    # Skip at collection time so integration tests never resolve fixtures or start an event loop
+    if os.getenv("INTEGRATION_TEST"):
+        return
+    
+    skip = pytest.mark.skip(reason="Integration test skipped - set INTEGRATION_TEST=true to run")
+    for item in items:
+        if "integration" in item.keywords:
+            item.add_marker(skip)
+
+
+@pytest.fixture
+def no_sleep(monkeypatch):
+    """Make backoff retries return immediately; returns the mock standing in for time.sleep.
+
+    exponential_backoff binds time.sleep when the decorator is built, so this only covers
+    functions decorated inside the test body.
+    """
+    sleep = Mock()
+    monkeypatch.setattr('bot.utils.time.sleep', sleep)
+    return sleep
+
+
+def _freeze(value):
+    """Read-only view of nested fixture data so session-scoped fixtures can be shared safely."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+@pytest.fixture(scope="session")
+def sample_exchange_info():
+    return _freeze({
+        'symbols': [
+            {
+                'symbol': 'BTCUSDT',
+                'status': 'TRADING',
+                'baseAsset': 'BTC',
+                'quoteAsset': 'USDT',
+                'filters': [
+                    {
+                        'filterType': 'LOT_SIZE',
+                        'minQty': '0.00100000',
+                        'maxQty': '100.00000000',
+                        'stepSize': '0.00100000'
+                    },
+                    {
+                        'filterType': 'PRICE_FILTER',
+                        'minPrice': '0.01000000',
+                        'maxPrice': '100000.00000000',
+                        'tickSize': '0.01000000'
+                    },
+                    {
+                        'filterType': 'MIN_NOTIONAL',
+                        'minNotional': '10.00000000'
+                    }
+                ]
+            }
+        ]
+    })
+
+
+@pytest.fixture(scope="session")
+def sample_account_info():
+    return _freeze({
+        'accountType': 'FUTURES',
+        'canTrade': True,
+        'canWithdraw': False,
+        'canDeposit': False,
+        'balances': [
+            {
+                'asset': 'USDT',
+                'balance': '1000.00000000',
+                'crossWalletBalance': '1000.00000000'
+            },
+            {
+                'asset': 'BTC',
+                'balance': '0.10000000',
+                'crossWalletBalance': '0.10000000'
+            }
+        ]
+    })
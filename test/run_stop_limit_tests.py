@@ -1,11 +1,17 @@
+import os
 import pytest
 import sys
 
 def run_stop_limit_tests():
     test_args = [
         "test/test_stop_limit_orders.py",
-        "-v",
-        "--tb=short"
+        "-q",
+        "--tb=short",
+        "--no-header",
+        # Autoload is off, so load the one plugin the suite needs explicitly
+        "-p", "pytest_asyncio.plugin",
+        "-p", "no:anyio",
+        "-p", "no:hypothesis"
     ]
     
     print("=" * 60)
@@ -13,7 +19,8 @@ def run_stop_limit_tests():
     print("=" * 60)
     print()
     
-
+    # Read when pytest.main() builds its config: skip scanning entry-point plugins
+    os.environ.setdefault("PYTEST_DISABLE_PLUGIN_AUTOLOAD", "1")
     exit_code = pytest.main(test_args)
     
     print("=" * 60)
@@ -475,14 +475,5 @@ class TestStopLimitCLI:
 pytestmark = pytest.mark.asyncio
 
 
-def pytest_configure(config):
-    config.addinivalue_line(
-        "markers", "integration: marks tests as integration tests"
-    )
-    config.addinivalue_line(
-        "markers", "stop_limit: marks tests as stop-limit specific tests"
-    )
-
-
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file
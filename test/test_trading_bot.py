@@ -1,103 +1,79 @@
 import pytest
 import asyncio
-from unittest.mock import Mock, patch, MagicMock, AsyncMock
+from unittest.mock import patch, MagicMock, AsyncMock
 from decimal import Decimal
 import os
 import time
+from types import SimpleNamespace
 from typing import Dict, Any
 
 
 from bot.utils import (
-    exponential_backoff, validate_order_parameters, format_quantity,
+    exponential_backoff, async_exponential_backoff, validate_order_parameters, format_quantity,
     format_price, load_environment_variables, ValidationError,
     RetryExhaustedError, validate_filters, RateLimiter
 )
 from bot.config import BotConfig
-from unittest.mock import Mock, patch, MagicMock, AsyncMock
-from decimal import Decimal
-import pytest
-import asyncio
-import os
-import time
-from typing import Dict, Any
 
 
 class TestUtils:
     """Test utility functions."""
     
-    def test_validate_order_parameters_valid(self):
-        """Test valid order parameter validation."""
-        params = validate_order_parameters(
-            symbol='BTCUSDT',
-            side='BUY',
-            order_type='LIMIT',
-            quantity='0.001',
-            price='50000.00',
-            time_in_force='GTC'
-        )
-        
-        assert params['symbol'] == 'BTCUSDT'
-        assert params['side'] == 'BUY'
-        assert params['type'] == 'LIMIT'
-        assert params['quantity'] == '0.001'
-        assert params['price'] == '50000.00'
-        assert params['timeInForce'] == 'GTC'
-    
-    def test_validate_order_parameters_invalid_side(self):
-        """Test invalid side parameter."""
-        with pytest.raises(ValidationError) as excinfo:
-            validate_order_parameters(
-                symbol='BTCUSDT',
-                side='INVALID',
-                order_type='LIMIT',
-                quantity='0.001'
-            )
-        assert "Side must be one of" in str(excinfo.value)
-    
-    def test_validate_order_parameters_invalid_quantity(self):
-        """Test invalid quantity parameter."""
-        with pytest.raises(ValidationError) as excinfo:
-            validate_order_parameters(
-                symbol='BTCUSDT',
-                side='BUY',
-                order_type='LIMIT',
-                quantity='-0.001'
-            )
-        assert "Quantity must be positive" in str(excinfo.value)
-    
-    def test_validate_order_parameters_market_order(self):
-        """Test market order validation."""
-        params = validate_order_parameters(
-            symbol='BTCUSDT',
-            side='BUY',
-            order_type='MARKET',
-            quantity='0.001'
-        )
-        
-        assert 'price' not in params
-        assert 'timeInForce' not in params
-    
-    def test_validate_order_parameters_stop_order(self):
-        """Test stop order validation."""
-        params = validate_order_parameters(
-            symbol='BTCUSDT',
-            side='BUY',
-            order_type='STOP_MARKET',
-            quantity='0.001',
-            stop_price='49000.00'
-        )
+    def test_validate_order_parameters(self):
+        """Test order parameter validation across order types and invalid inputs."""
+        base = {'symbol': 'BTCUSDT', 'side': 'BUY', 'quantity': '0.001'}
+        absent = object()  # expected value for keys that must not be in params at all
+        cases = [
+            (
+                dict(base, order_type='LIMIT', price='50000.00', time_in_force='GTC'),
+                {'symbol': 'BTCUSDT', 'side': 'BUY', 'type': 'LIMIT', 'quantity': '0.001',
+                 'price': '50000.00', 'timeInForce': 'GTC'}
+            ),
+            (dict(base, order_type='MARKET'), {'price': absent, 'timeInForce': absent}),
+            (dict(base, order_type='STOP_MARKET', stop_price='49000.00'), {'stopPrice': '49000.00'}),
+            (dict(base, side='INVALID', order_type='LIMIT'), (ValidationError, "Side must be one of")),
+            (dict(base, order_type='LIMIT', quantity='-0.001'), (ValidationError, "Quantity must be positive")),
+            (dict(base, side=['BUY'], order_type='MARKET'), (ValidationError, "Side must be one of")),
+            (dict(base, order_type=['MARKET']), (ValidationError, "Order type must be one of")),
+            (
+                dict(base, order_type='LIMIT', price='50000.00', time_in_force={'GTC'}),
+                (ValidationError, "Time in force must be one of")
+            ),
+        ]
         
-        assert params['stopPrice'] == '49000.00'
-    
-    def test_format_quantity(self):
-        assert format_quantity(0.123456789, 3) == "0.123"
-        assert format_quantity("0.123456789", 5) == "0.12345"
-        assert format_quantity(Decimal("0.123456789"), 2) == "0.12"
-    
-    def test_format_price(self):
-        assert format_price(50000.123, "0.01") == "50000.12"
-        assert format_price("50000.999", "0.1") == "50000.9"
-        assert format_price(Decimal("50000.555"), Decimal("0.001")) == "50000.555"
+        for kwargs, expected in cases:
+            if isinstance(expected, tuple):
+                error_type, message = expected
+                with pytest.raises(error_type) as excinfo:
+                    validate_order_parameters(**kwargs)
+                assert message in str(excinfo.value), f"{kwargs}: {excinfo.value}"
+            else:
+                params = validate_order_parameters(**kwargs)
+                for key, value in expected.items():
+                    if value is absent:
+                        assert key not in params, f"{kwargs}: unexpected {key}={params[key]!r}"
+                    else:
+                        assert params.get(key) == value, f"{kwargs}: {key}={params.get(key)!r}"
+    
+    def test_format_quantity_cases(self):
+        cases = [
+            (0.123456789, 3, "0.123"),
+            ("0.123456789", 5, "0.12345"),
+            (Decimal("0.123456789"), 2, "0.12"),
+        ]
+        for quantity, precision, expected in cases:
+            result = format_quantity(quantity, precision)
+            assert result == expected, f"format_quantity({quantity!r}, {precision}) -> {result}"
+    
+    def test_format_price_cases(self):
+        cases = [
+            (50000.123, "0.01", "50000.12"),
+            ("50000.999", "0.1", "50000.9"),
+            (Decimal("50000.555"), Decimal("0.001"), "50000.555"),
+        ]
+        for price, tick_size, expected in cases:
+            result = format_price(price, tick_size)
+            assert result == expected, f"format_price({price!r}, {tick_size!r}) -> {result}"
     
     def test_validate_filters_lot_size(self):
         symbol_info = {
@@ -122,7 +98,7 @@ class TestUtils:
         assert is_valid is False
         assert "below minimum" in error
     
-    def test_exponential_backoff_decorator(self):
+    def test_exponential_backoff_decorator(self, no_sleep):
         call_count = 0
         
         @exponential_backoff(max_retries=2, base_delay=0.1)
@@ -136,14 +112,16 @@ class TestUtils:
         result = failing_function()
         assert result == "success"
         assert call_count == 3
+        assert no_sleep.call_count == 2
     
-    def test_exponential_backoff_exhausted(self):
+    def test_exponential_backoff_exhausted(self, no_sleep):
         @exponential_backoff(max_retries=1, base_delay=0.1)
         def always_failing_function():
             raise Exception("Always fails")
         
         with pytest.raises(RetryExhaustedError):
             always_failing_function()
+        assert no_sleep.call_count == 1
     
     def test_rate_limiter(self):
         limiter = RateLimiter(max_requests=2, time_window=1.0)
@@ -175,22 +153,33 @@ class TestUtils:
         assert 'MAX_RETRIES' in env_vars
 
 
+class _StubBinanceClient:
+    """Plain stand-in for the Binance client; only the endpoints tests configure are mocks."""
+    
+    def __init__(self):
+        self.get_account = MagicMock()
+        self.get_exchange_info = MagicMock()
+        self.new_order = MagicMock()
+        self.get_order = MagicMock()
+        self.cancel_order = MagicMock()
+        self.new_oco_order = MagicMock()
+
+
 class TestBasicBot:
     @pytest.fixture
     def mock_config(self):
         """Mock configuration."""
-        config = Mock(spec=BotConfig)
-        config.api_key = 'test_key'
-        config.secret_key = 'test_secret'
-        config.testnet = True
-        config.max_retries = 3
-        config.base_delay = 1.0
-        return config
+        return SimpleNamespace(
+            api_key='test_key',
+            secret_key='test_secret',
+            testnet=True,
+            max_retries=3,
+            base_delay=1.0
+        )
     
     @pytest.fixture
     def mock_client(self):
-        client = Mock(spec=BinanceClient)
-        return client
+        return _StubBinanceClient()
     
     @pytest.fixture
     def basic_bot(self, mock_config, mock_client):
@@ -322,7 +311,7 @@ class TestOrderManager:
     @pytest.fixture
     def mock_client(self):
         """Mock Binance client."""
-        return Mock(spec=BinanceClient)
+        return _StubBinanceClient()
     
     @pytest.fixture
     def order_manager(self, mock_client):
@@ -391,17 +380,16 @@ class TestOrderManager:
         
         assert len(sub_orders) == expected_sub_orders
 
-        total_qty = sum(Decimal(order['quantity']) for order in sub_orders)
-        assert abs(total_qty - Decimal('0.01')) < Decimal('0.00001')
+        # Compare in 1e-8 ticks: 0.01 is 1_000_000 ticks, the 0.00001 tolerance is 1_000
+        total_ticks = sum(int(round(float(order['quantity']) * 1e8)) for order in sub_orders)
+        assert abs(total_ticks - 1_000_000) < 1_000
     
     @pytest.mark.asyncio
     async def test_twap_order_execution(self, order_manager, mock_client):
         """Test TWAP order execution."""
-        mock_client.new_order = AsyncMock()
-        mock_client.new_order.return_value = {
-            'orderId': 12350,
-            'status': 'FILLED'
-        }
+        mock_client.new_order = AsyncMock(
+            side_effect=[{'orderId': 12350 + i, 'status': 'FILLED'} for i in range(2)]
+        )
         
         twap_order = TWAPOrder(
             symbol='BTCUSDT',
@@ -417,6 +405,7 @@ class TestOrderManager:
         
         assert len(results) == 2
         assert all(result['status'] == 'FILLED' for result in results)
+        assert mock_client.new_order.await_count == 2
     
     def test_order_validation_error(self, order_manager):
         """Test order validation errors."""
@@ -451,9 +440,6 @@ class TestIntegration:
     @pytest.mark.integration
     @pytest.mark.asyncio
     async def test_testnet_market_order_integration(self):
-        if not os.getenv('INTEGRATION_TEST'):
-            pytest.skip("Integration test skipped - set INTEGRATION_TEST=true to run")
-        
         try:
 
             env_vars = load_environment_variables()
@@ -507,9 +493,6 @@ class TestIntegration:
     
     @pytest.mark.integration
     def test_testnet_limit_order_integration(self):
-        if not os.getenv('INTEGRATION_TEST'):
-            pytest.skip("Integration test skipped - set INTEGRATION_TEST=true to run")
-        
         try:
             config = BotConfig()
             config.load_from_env()
@@ -548,7 +531,7 @@ class TestIntegration:
 
 class TestErrorHandling:
     
-    def test_network_error_retry(self):
+    def test_network_error_retry(self, no_sleep):
         call_count = 0
         
         @exponential_backoff(max_retries=2, base_delay=0.1)
@@ -562,8 +545,9 @@ class TestErrorHandling:
         result = network_call()
         assert result["status"] == "success"
         assert call_count == 2
+        assert no_sleep.call_count == 1
     
-    def test_binance_api_error_no_retry(self):
+    def test_binance_api_error_no_retry(self, no_sleep):
         @exponential_backoff(max_retries=2, base_delay=0.1)
         def api_call():
             error = Exception("Insufficient balance")
@@ -574,6 +558,7 @@ class TestErrorHandling:
             api_call()
         
         assert "Insufficient balance" in str(excinfo.value)
+        no_sleep.assert_not_called()
     
     def test_malformed_order_parameters(self):
         with pytest.raises(ValidationError):
@@ -591,77 +576,48 @@ class TestErrorHandling:
             )
     
     def test_precision_edge_cases(self):
-        assert format_quantity(0.00000001, 8) == "0.00000001"
-        
-
-        assert format_quantity(0.999999, 2) == "0.99"
-        
-
-        assert format_price(50000.555, "0.01") == "50000.55"
-
-
-
-pytestmark = pytest.mark.asyncio
-
-
-def pytest_configure(config):
-    config.addinivalue_line(
-        "markers", "integration: marks tests as integration tests (deselect with '-m \"not integration\"')"
-    )
-
-@pytest.fixture
-def sample_exchange_info():
-    return {
-        'symbols': [
-            {
-                'symbol': 'BTCUSDT',
-                'status': 'TRADING',
-                'baseAsset': 'BTC',
-                'quoteAsset': 'USDT',
-                'filters': [
-                    {
-                        'filterType': 'LOT_SIZE',
-                        'minQty': '0.00100000',
-                        'maxQty': '100.00000000',
-                        'stepSize': '0.00100000'
-                    },
-                    {
-                        'filterType': 'PRICE_FILTER',
-                        'minPrice': '0.01000000',
-                        'maxPrice': '100000.00000000',
-                        'tickSize': '0.01000000'
-                    },
-                    {
-                        'filterType': 'MIN_NOTIONAL',
-                        'minNotional': '10.00000000'
-                    }
-                ]
-            }
+        cases = [
+            (format_quantity, (0.00000001, 8), "0.00000001"),
+            (format_quantity, (0.999999, 2), "0.99"),
+            (format_price, (50000.555, "0.01"), "50000.55"),
         ]
-    }
-
+        for formatter, args, expected in cases:
+            result = formatter(*args)
+            assert result == expected, f"{formatter.__name__}{args} -> {result}"
 
-@pytest.fixture
-def sample_account_info():
-    return {
-        'accountType': 'FUTURES',
-        'canTrade': True,
-        'canWithdraw': False,
-        'canDeposit': False,
-        'balances': [
-            {
-                'asset': 'USDT',
-                'balance': '1000.00000000',
-                'crossWalletBalance': '1000.00000000'
-            },
-            {
-                'asset': 'BTC',
-                'balance': '0.10000000',
-                'crossWalletBalance': '0.10000000'
-            }
-        ]
-    }
 
+class TestAsyncBackoff:
+    
+    @pytest.mark.asyncio
+    async def test_async_exponential_backoff_concurrent(self, monkeypatch):
+        attempts = {}
+        sleeping = 0
+        overlap = 0
+        real_sleep = asyncio.sleep
+        
+        async def counting_sleep(delay):
+            # Counts how many retries are waiting at once, without real wall-clock waits
+            nonlocal sleeping, overlap
+            sleeping += 1
+            overlap = max(overlap, sleeping)
+            await real_sleep(0)
+            sleeping -= 1
+        
+        # The decorator binds asyncio.sleep when it is built, so patch first
+        monkeypatch.setattr('asyncio.sleep', counting_sleep)
+        
+        @async_exponential_backoff(max_retries=1, base_delay=0.2, jitter=False)
+        async def flaky_call(i):
+            attempts[i] = attempts.get(i, 0) + 1
+            if attempts[i] == 1:
+                raise ConnectionError("Network error")
+            return i
+        
+        results = await asyncio.gather(*(flaky_call(i) for i in range(5)))
+        
+        assert results == [0, 1, 2, 3, 4]
+        # Retries must sleep concurrently: all five backoffs overlap
+        assert overlap == 5
 
 
 def assert_order_params(params, expected_symbol, expected_side, expected_type):
@@ -1,19 +1,48 @@
+import copy
 import pytest
-import asyncio
-from unittest.mock import Mock, patch, MagicMock, AsyncMock
+from unittest.mock import patch, create_autospec
 from decimal import Decimal
-import os
 import time
-from typing import Dict, Any
+from types import SimpleNamespace
+
+from binance.client import Client
 
 from bot.utils import (
     exponential_backoff, validate_order_parameters, format_quantity,
     format_price, load_environment_variables, ValidationError,
-    RetryExhaustedError, validate_filters, RateLimiter
+    RetryExhaustedError, validate_filters, RateLimiter, truncate_to_precision
 )
 from bot.basic_bot import BasicBot
 
 
+_DECIMAL_QUANTITY = Decimal("0.123456789")
+_DECIMAL_PRICE = Decimal("50000.555")
+_DECIMAL_TICK = Decimal("0.001")
+
+_LOT_SIZE_SYMBOL_INFO = {
+    'filters': [
+        {
+            'filterType': 'LOT_SIZE',
+            'minQty': '0.001',
+            'maxQty': '10.0',
+            'stepSize': '0.001'
+        }
+    ]
+}
+
+# Exponent-form sizes, as Decimal prints very small steps
+_EXPONENT_LOT_SIZE_SYMBOL_INFO = {
+    'filters': [
+        {
+            'filterType': 'LOT_SIZE',
+            'minQty': '1E-8',
+            'maxQty': '100',
+            'stepSize': '1E-8'
+        }
+    ]
+}
+
+
 class TestUtils:
     
     def test_validate_order_parameters_valid(self):
@@ -76,39 +105,65 @@ class TestUtils:
         
         assert params['stopPrice'] == '49000.00'
     
-    def test_format_quantity(self):
-        assert format_quantity(0.123456789, 3) == "0.123"
-        assert format_quantity("0.123456789", 5) == "0.12345"
-        assert format_quantity(Decimal("0.123456789"), 2) == "0.12"
+    @pytest.mark.parametrize("quantity,precision,expected", [
+        (0.123456789, 3, "0.123"),
+        ("0.123456789", 5, "0.12345"),
+        (_DECIMAL_QUANTITY, 2, "0.12"),
+    ])
+    def test_format_quantity(self, quantity, precision, expected):
+        assert format_quantity(quantity, precision) == expected
     
-    def test_format_price(self):
-        assert format_price(50000.123, "0.01") == "50000.12"
-        assert format_price("50000.999", "0.1") == "50000.9"
-        assert format_price(Decimal("50000.555"), Decimal("0.001")) == "50000.555"
+    @pytest.mark.parametrize("price,tick_size,expected", [
+        (50000.123, "0.01", "50000.12"),
+        ("50000.999", "0.1", "50000.9"),
+        (_DECIMAL_PRICE, _DECIMAL_TICK, "50000.555"),
+    ])
+    def test_format_price(self, price, tick_size, expected):
+        assert format_price(price, tick_size) == expected
     
-    def test_validate_filters_lot_size(self):
-        symbol_info = {
-            'filters': [
-                {
-                    'filterType': 'LOT_SIZE',
-                    'minQty': '0.001',
-                    'maxQty': '10.0',
-                    'stepSize': '0.001'
-                }
-            ]
-        }
-        
-        params = {'quantity': '0.005'}
-        is_valid, error = validate_filters(params, symbol_info)
-        assert is_valid is True
-        assert error is None
-        
-        params = {'quantity': '0.0005'}
-        is_valid, error = validate_filters(params, symbol_info)
+    @pytest.mark.parametrize("value,precision,expected", [
+        ("0.123456789", 3, "0.123"),
+        ("-0.0001", 2, "0.00"),
+        # Needs more digits than the default 28-digit decimal context
+        (1e20, 10, "100000000000000000000.0000000000"),
+    ])
+    def test_truncate_to_precision(self, value, precision, expected):
+        assert truncate_to_precision(value, precision) == expected
+    
+    @pytest.mark.parametrize("quantity,expected_error", [
+        ('0.005', None),
+        ('0.0005', "below minimum"),
+    ])
+    def test_validate_filters_lot_size(self, quantity, expected_error):
+        is_valid, error = validate_filters({'quantity': quantity}, _LOT_SIZE_SYMBOL_INFO)
+        if expected_error is None:
+            assert is_valid is True
+            assert error is None
+        else:
+            assert is_valid is False
+            assert expected_error in error
+    
+    @pytest.mark.parametrize("quantity,expected_error", [
+        ('0.5', None),
+        ('0.00000001', None),
+        ('0.000000015', "step size"),
+        ('0.000000001', "below minimum"),
+    ])
+    def test_validate_filters_exponent_step_size(self, quantity, expected_error):
+        is_valid, error = validate_filters({'quantity': quantity}, _EXPONENT_LOT_SIZE_SYMBOL_INFO)
+        if expected_error is None:
+            assert is_valid is True
+            assert error is None
+        else:
+            assert is_valid is False
+            assert expected_error in error
+    
+    def test_validate_filters_malformed_symbol_info(self):
+        is_valid, error = validate_filters({'quantity': '0.005'}, None)
         assert is_valid is False
-        assert "below minimum" in error
+        assert error.startswith("Filter validation error")
     
-    def test_exponential_backoff_decorator(self):
+    def test_exponential_backoff_decorator(self, no_sleep):
         call_count = 0
         
         @exponential_backoff(max_retries=2, base_delay=0.1)
@@ -122,32 +177,55 @@ class TestUtils:
         result = failing_function()
         assert result == "success"
         assert call_count == 3
+        assert no_sleep.call_count == 2
     
-    def test_exponential_backoff_exhausted(self):
+    def test_exponential_backoff_exhausted(self, no_sleep):
         @exponential_backoff(max_retries=1, base_delay=0.1)
         def always_failing_function():
             raise Exception("Always fails")
         
         with pytest.raises(RetryExhaustedError):
             always_failing_function()
+        assert no_sleep.call_count == 1
     
     def test_rate_limiter(self):
-        limiter = RateLimiter(max_requests=2, time_window=1.0)
+        # Fake nanosecond clock: construction and three acquires at t=0, wait_time at t=0.5s
+        clock = iter([0, 0, 0, 0, 500_000_000]).__next__
+        limiter = RateLimiter(max_requests=2, time_window=1.0, time_source=clock)
         
         assert limiter.acquire() is True
         assert limiter.acquire() is True
         
         assert limiter.acquire() is False
         
+        # The full bucket only stops blocking once it is the previous bucket and has
+        # started to decay, i.e. 1ns past the end of the current window
         wait_time = limiter.wait_time()
-        assert wait_time > 0
+        assert wait_time == 0.500000001
     
-    @patch.dict(os.environ, {
-        'BINANCE_API_KEY': 'test_key',
-        'BINANCE_SECRET_KEY': 'test_secret',
-        'BINANCE_TESTNET': 'true'
-    })
-    def test_load_environment_variables(self):
+    @pytest.mark.parametrize("max_requests,time_window", [(1, 1.0), (2, 1.0), (3, 0.25), (10, 60.0)])
+    def test_rate_limiter_wait_time_admits_next_request(self, max_requests, time_window):
+        now = 0
+        limiter = RateLimiter(max_requests, time_window, time_source=lambda: now)
+        
+        for _ in range(20):
+            while limiter.acquire():
+                pass
+            
+            # Sleeping for wait_time() must be exactly enough: 1ns less still blocks
+            wait_ns = round(limiter.wait_time() * 1_000_000_000)
+            assert wait_ns > 0
+            now += wait_ns - 1
+            assert limiter.acquire() is False
+            now += 1
+            assert limiter.acquire() is True
+    
+    @pytest.mark.parametrize("time_window", [0, -1.0])
+    def test_rate_limiter_rejects_non_positive_window(self, time_window):
+        with pytest.raises(ValueError):
+            RateLimiter(max_requests=2, time_window=time_window)
+    
+    def test_load_environment_variables(self, binance_env):
         """Test environment variable loading."""
         env_vars = load_environment_variables()
         
@@ -158,15 +236,45 @@ class TestUtils:
         assert 'MAX_RETRIES' in env_vars
 
 
+def _stub_endpoint(endpoint, response):
+    def call(*args, **kwargs):
+        call.kwargs = kwargs
+        return response
+    
+    # BasicBot._make_api_call decides on the timestamp kwarg by finding the endpoint name in str(func)
+    call.__name__ = call.__qualname__ = endpoint
+    call.kwargs = None
+    return call
+
+
+def _stub_client(**responses):
+    """Plain stand-in for the Binance client; each endpoint just returns its canned response."""
+    return SimpleNamespace(**{
+        endpoint: _stub_endpoint(endpoint, response)
+        for endpoint, response in responses.items()
+    })
+
+
 class TestBasicBot:
-    @pytest.fixture
-    def mock_client(self):
-        return Mock()
+    @pytest.fixture(scope="session")
+    def bot_template(self, sample_exchange_info):
+        # Built once against an autospec'd client so no test pays for (or
+        # needs network for) a real Client construction
+        client = create_autospec(Client, instance=True)
+        client.configure_mock(**{
+            'get_server_time.return_value': {'serverTime': int(time.time() * 1000)},
+            'futures_exchange_info.return_value': sample_exchange_info
+        })
+        
+        with patch('bot.basic_bot.Client', return_value=client):
+            return BasicBot('test_key', 'test_secret', testnet=True)
     
     @pytest.fixture
-    def basic_bot(self, mock_client):
-        bot = BasicBot('test_key', 'test_secret', testnet=True)
-        bot.client = mock_client
+    def basic_bot(self, bot_template):
+        bot = copy.copy(bot_template)
+        # The only state BasicBot mutates in place; everything else is rebound
+        bot.symbol_filters = dict(bot_template.symbol_filters)
+        bot.client = _stub_client()
         return bot
     
     def test_init_valid_credentials(self):
@@ -177,28 +285,62 @@ class TestBasicBot:
         with pytest.raises(ValueError):
             BasicBot('', '', testnet=True)
     
-    def test_validate_symbol_valid(self, basic_bot, mock_client):
-        mock_client.futures_exchange_info.return_value = {
-            'symbols': [
-                {
-                    'symbol': 'BTCUSDT',
-                    'status': 'TRADING',
-                    'filters': []
-                }
-            ]
-        }
+    def test_validate_symbol_valid(self, basic_bot, sample_exchange_info):
+        basic_bot.client = _stub_client(futures_exchange_info=sample_exchange_info)
+        # Drop the template's cached copy so the lookup goes through the client
+        basic_bot.exchange_info = None
         
         result = basic_bot.validate_symbol('BTCUSDT')
         assert result is True
     
-    def test_get_symbol_price(self, basic_bot, mock_client):
-        mock_client.futures_symbol_ticker.return_value = {'price': '50000.0'}
+    def test_get_symbol_info_hit_and_miss(self, basic_bot):
+        assert basic_bot.get_symbol_info('BTCUSDT')['symbol'] == 'BTCUSDT'
+        assert basic_bot.get_symbol_info('ETHUSDT') is None
+    
+    def test_get_symbol_info_ignores_case(self, basic_bot):
+        assert basic_bot.get_symbol_info('btcusdt') is basic_bot.get_symbol_info('BTCUSDT')
+    
+    def test_get_symbol_info_refreshes_after_ttl(self, basic_bot):
+        basic_bot.client = _stub_client(futures_exchange_info={
+            'symbols': [{'symbol': 'ETHUSDT', 'status': 'TRADING', 'filters': []}]
+        })
+        assert basic_bot.get_symbol_info('ETHUSDT') is None
+        
+        basic_bot._exchange_info_fetched_at -= BasicBot.EXCHANGE_INFO_TTL
+        
+        assert basic_bot.get_symbol_info('ETHUSDT')['symbol'] == 'ETHUSDT'
+        assert basic_bot.get_symbol_info('BTCUSDT') is None
+    
+    def test_get_symbol_info_keeps_stale_data_when_refresh_fails(self, basic_bot):
+        def unavailable(**kwargs):
+            raise RuntimeError("exchange info unavailable")
+        
+        basic_bot.client = SimpleNamespace(futures_exchange_info=unavailable)
+        basic_bot._exchange_info_fetched_at -= BasicBot.EXCHANGE_INFO_TTL
+        
+        assert basic_bot.get_symbol_info('BTCUSDT')['symbol'] == 'BTCUSDT'
+        # The failed refresh restarts the TTL rather than retrying on every lookup
+        assert time.monotonic() - basic_bot._exchange_info_fetched_at < BasicBot.EXCHANGE_INFO_TTL
+    
+    def test_assigning_exchange_info_invalidates_symbol_index(self, basic_bot):
+        assert basic_bot.get_symbol_info('BTCUSDT') is not None
+        
+        basic_bot.exchange_info = {
+            'symbols': [{'symbol': 'ETHUSDT', 'status': 'TRADING', 'filters': []}]
+        }
+        
+        assert basic_bot.get_symbol_info('ETHUSDT')['symbol'] == 'ETHUSDT'
+        assert basic_bot.get_symbol_info('BTCUSDT') is None
+    
+    def test_get_symbol_price(self, basic_bot):
+        basic_bot.client = _stub_client(futures_symbol_ticker={'price': '50000.0'})
         
         price = basic_bot.get_symbol_price('BTCUSDT')
         assert price == 50000.0
+        assert 'timestamp' in basic_bot.client.futures_symbol_ticker.kwargs
     
-    def test_get_account_balance(self, basic_bot, mock_client):
-        mock_client.futures_account.return_value = {
+    def test_get_account_balance(self, basic_bot):
+        basic_bot.client = _stub_client(futures_account={
             'assets': [
                 {
                     'asset': 'USDT',
@@ -206,122 +348,51 @@ class TestBasicBot:
                     'walletBalance': '1500.0'
                 }
             ]
-        }
+        })
         
         balance = basic_bot.get_account_balance('USDT')
         assert balance['available'] == 1000.0
         assert balance['total'] == 1500.0
     
-    def test_place_market_order_success(self, basic_bot, mock_client):
-        mock_client.futures_create_order.return_value = {
+    @pytest.mark.parametrize("method,args,response", [
+        ('place_market_order', ('BTCUSDT', 'BUY', 0.001), {
             'orderId': 12345,
             'symbol': 'BTCUSDT',
             'status': 'FILLED',
             'executedQty': '0.001',
             'side': 'BUY',
             'type': 'MARKET'
-        }
-        
-        order = basic_bot.place_market_order('BTCUSDT', 'BUY', 0.001)
-        assert order['orderId'] == 12345
-        assert order['status'] == 'FILLED'
-    
-    def test_place_limit_order_success(self, basic_bot, mock_client):
-        mock_client.futures_create_order.return_value = {
+        }),
+        ('place_limit_order', ('BTCUSDT', 'SELL', 0.001, 51000.0), {
             'orderId': 12346,
             'symbol': 'BTCUSDT',
             'status': 'NEW',
             'side': 'SELL',
             'type': 'LIMIT',
             'price': '51000.0'
-        }
-        
-        order = basic_bot.place_limit_order('BTCUSDT', 'SELL', 0.001, 51000.0)
-        assert order['orderId'] == 12346
-        assert order['status'] == 'NEW'
-    
-    def test_buy_market_convenience(self, basic_bot, mock_client):
-        mock_client.futures_create_order.return_value = {'orderId': 12347}
-        
-        order = basic_bot.buy_market('BTCUSDT', 0.001)
-        assert order['orderId'] == 12347
-    
-    def test_sell_market_convenience(self, basic_bot, mock_client):
-        mock_client.futures_create_order.return_value = {'orderId': 12348}
-        
-        order = basic_bot.sell_market('BTCUSDT', 0.001)
-        assert order['orderId'] == 12348
-    
-    def test_buy_limit_convenience(self, basic_bot, mock_client):
-        mock_client.futures_create_order.return_value = {'orderId': 12349}
-        
-        order = basic_bot.buy_limit('BTCUSDT', 0.001, 50000.0)
-        assert order['orderId'] == 12349
-    
-    def test_sell_limit_convenience(self, basic_bot, mock_client):
-        mock_client.futures_create_order.return_value = {'orderId': 12350}
+        }),
+        ('buy_market', ('BTCUSDT', 0.001), {'orderId': 12347}),
+        ('sell_market', ('BTCUSDT', 0.001), {'orderId': 12348}),
+        ('buy_limit', ('BTCUSDT', 0.001, 50000.0), {'orderId': 12349}),
+        ('sell_limit', ('BTCUSDT', 0.001, 50000.0), {'orderId': 12350}),
+    ])
+    def test_place_order_success(self, basic_bot, method, args, response):
+        # Market orders price their MIN_NOTIONAL check off the ticker
+        basic_bot.client = _stub_client(
+            futures_create_order=response,
+            futures_symbol_ticker={'price': '50000.0'}
+        )
         
-        order = basic_bot.sell_limit('BTCUSDT', 0.001, 50000.0)
-        assert order['orderId'] == 12350
-
-
-def pytest_configure(config):
-    config.addinivalue_line(
-        "markers", "integration: marks tests as integration tests (deselect with '-m \"not integration\"')"
-    )
-
-@pytest.fixture
-def sample_exchange_info():
-    return {
-        'symbols': [
-            {
-                'symbol': 'BTCUSDT',
-                'status': 'TRADING',
-                'baseAsset': 'BTC',
-                'quoteAsset': 'USDT',
-                'filters': [
-                    {
-                        'filterType': 'LOT_SIZE',
-                        'minQty': '0.00100000',
-                        'maxQty': '100.00000000',
-                        'stepSize': '0.00100000'
-                    },
-                    {
-                        'filterType': 'PRICE_FILTER',
-                        'minPrice': '0.01000000',
-                        'maxPrice': '100000.00000000',
-                        'tickSize': '0.01000000'
-                    },
-                    {
-                        'filterType': 'MIN_NOTIONAL',
-                        'minNotional': '10.00000000'
-                    }
-                ]
-            }
-        ]
-    }
+        order = getattr(basic_bot, method)(*args)
+        assert order == response
+        assert 'timestamp' in basic_bot.client.futures_create_order.kwargs
 
 
 @pytest.fixture
-def sample_account_info():
-    return {
-        'accountType': 'FUTURES',
-        'canTrade': True,
-        'canWithdraw': False,
-        'canDeposit': False,
-        'balances': [
-            {
-                'asset': 'USDT',
-                'balance': '1000.00000000',
-                'crossWalletBalance': '1000.00000000'
-            },
-            {
-                'asset': 'BTC',
-                'balance': '0.10000000',
-                'crossWalletBalance': '0.10000000'
-            }
-        ]
-    }
+def binance_env(monkeypatch):
+    monkeypatch.setenv('BINANCE_API_KEY', 'test_key')
+    monkeypatch.setenv('BINANCE_SECRET_KEY', 'test_secret')
+    monkeypatch.setenv('BINANCE_TESTNET', 'true')
 
 
 if __name__ == "__main__":